@@ -98,21 +98,19 @@ const ExecutiveDashboard: React.FC = () => {
       setError(null);
 
       // Fetch all data in parallel
-      const [statsRes, zonesRes, issuesRes, spacesRes, perfRes, netHealthRes] = await Promise.all([
+      const [statsRes, zonesRes, spacesRes, snapshotRes] = await Promise.all([
         axios.get(`${API_BASE}/api/stats`),
         axios.get(`${API_BASE}/api/zones`),
-        axios.get(`${API_BASE}/api/executive/issues`),
         axios.get(`${API_BASE}/api/spaces`),
-        axios.get(`${API_BASE}/api/executive/performance`),
-        axios.get(`${API_BASE}/api/executive/network-health`),
+        axios.get(`${API_BASE}/api/executive/snapshot`),
       ]);
 
       setStats(statsRes.data);
       setZones(zonesRes.data);
-      setIssues(issuesRes.data);
+      setIssues(snapshotRes.data.issues);
       setMatterportSpaces(spacesRes.data);
-      setPerformance(perfRes.data);
-      setNetworkHealth(netHealthRes.data);
+      setPerformance(snapshotRes.data.performance);
+      setNetworkHealth(snapshotRes.data.network);
       setLastUpdate(new Date());
     } catch (err: any) {
       console.error('Failed to fetch dashboard data:', err);
@@ -106,9 +106,7 @@ const GitOpsDriftDashboard: React.FC = () => {
   const [resolving, setResolving] = useState(false);
 
   useEffect(() => {
-    fetchDriftData();
-    fetchDriftHistory();
-    fetchDriftStats();
+    fetchDashboard();
 
     // Refresh every 30 seconds
     const interval = setInterval(() => {
@@ -130,21 +128,18 @@ const GitOpsDriftDashboard: React.FC = () => {
     }
   };
 
-  const fetchDriftHistory = async () => {
-    try {
-      const response = await axios.get(`${API_BASE}/api/gitops/drift/history?days=7`);
-      setDriftHistory(response.data);
-    } catch (error) {
-      console.error('Failed to fetch drift history:', error);
-    }
-  };
-
-  const fetchDriftStats = async () => {
+  // Initial load: drift, history and stats in one request
+  const fetchDashboard = async () => {
+    setLoading(true);
     try {
-      const response = await axios.get(`${API_BASE}/api/gitops/drift/stats`);
-      setDriftStats(response.data);
+      const response = await axios.get(`${API_BASE}/api/gitops/dashboard?days=7`);
+      setDriftData(response.data.drift);
+      setDriftHistory(response.data.history);
+      setDriftStats(response.data.stats);
     } catch (error) {
-      console.error('Failed to fetch drift stats:', error);
+      console.error('Failed to fetch GitOps dashboard:', error);
+    } finally {
+      setLoading(false);
     }
   };
 
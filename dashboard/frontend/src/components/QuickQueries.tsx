@@ -26,6 +26,10 @@ import axios from 'axios';
 
 const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
+// Expands a columnar { columns, rows } payload into one object per row
+const zipRows = (columns: string[], rows: any[][]) =>
+  rows.map((row) => Object.fromEntries(columns.map((column, i) => [column, row[i]])));
+
 interface Query {
   id: string;
   title: string;
@@ -301,6 +305,7 @@ const QuickQueries: React.FC = () => {
       switch (queryId) {
         case 'all-dependencies':
           response = await axios.get(`${API_BASE}/api/graph/dependencies`);
+          response.data.dependencies = zipRows(response.data.columns, response.data.rows);
           break;
         case 'critical-paths':
           response = await axios.get(`${API_BASE}/api/graph/critical-paths`);
@@ -309,7 +314,9 @@ const QuickQueries: React.FC = () => {
           response = await axios.get(`${API_BASE}/api/rca/failure-cascades`);
           break;
         case 'upstream-analysis':
-          response = await axios.get(`${API_BASE}/api/rca/upstream-analysis-all`);
+          response = await axios.get(`${API_BASE}/api/rca/upstream-analysis-all`, {
+            params: { fields: 'name,type,status,distance' },
+          });
           break;
         case 'impact-radius':
           response = await axios.get(`${API_BASE}/api/rca/blast-radius-all`);
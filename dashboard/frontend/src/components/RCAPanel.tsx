@@ -107,6 +107,11 @@ const RCAPanel: React.FC<RCAPanelProps> = ({ assetContext }) => {
         assetName: incidentNumber.trim(),
       });
 
+      if (response.data.error) {
+        setError(response.data.error);
+        return;
+      }
+
       setIncidentTrace(response.data);
 
       // Fetch related incidents for this asset
@@ -138,6 +143,11 @@ const RCAPanel: React.FC<RCAPanelProps> = ({ assetContext }) => {
         assetName: assetName,
       });
 
+      if (response.data.error) {
+        setError(response.data.error);
+        return;
+      }
+
       setIncidentTrace(response.data);
 
       // Fetch related incidents for this asset
@@ -121,19 +121,17 @@ const UnifiedDashboard: React.FC = () => {
   const fetchAllData = async () => {
     setLoading(true);
     try {
-      const [statsRes, zonesRes, issuesRes, perfRes, netRes] = await Promise.all([
+      const [statsRes, zonesRes, snapshotRes] = await Promise.all([
         axios.get(`${API_BASE}/api/stats`),
         axios.get(`${API_BASE}/api/zones`),
-        axios.get(`${API_BASE}/api/executive/issues`),
-        axios.get(`${API_BASE}/api/executive/performance`),
-        axios.get(`${API_BASE}/api/executive/network-health`),
+        axios.get(`${API_BASE}/api/executive/snapshot`),
       ]);
 
       setStats(statsRes.data);
       setZones(zonesRes.data);
-      setIssues(issuesRes.data.slice(0, 5)); // Top 5 issues
-      setPerformance(perfRes.data);
-      setNetworkHealth(netRes.data);
+      setIssues(snapshotRes.data.issues.slice(0, 5)); // Top 5 issues
+      setPerformance(snapshotRes.data.performance);
+      setNetworkHealth(snapshotRes.data.network);
     } catch (error) {
       console.error('Failed to fetch dashboard data:', error);
     } finally {
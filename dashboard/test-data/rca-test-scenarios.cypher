@@ -280,7 +280,7 @@ CREATE (healthy3:Asset {name: 'Server-100', type: 'Server', status: 'running'});
 // Create indexes for performance
 CREATE INDEX asset_status IF NOT EXISTS FOR (a:Asset) ON (a.status);
 CREATE INDEX asset_type IF NOT EXISTS FOR (a:Asset) ON (a.type);
-CREATE INDEX asset_name IF NOT EXISTS FOR (a:Asset) ON (a.name);
+CREATE CONSTRAINT asset_name IF NOT EXISTS FOR (a:Asset) REQUIRE a.name IS UNIQUE;
 
 // =============================================================================
 // Summary